@@ -10,6 +10,8 @@ from capa.features.common import Feature
 
 
 class BasicBlock(Feature):
+    __slots__ = ()
+
     def __init__(self, description=None):
         super().__init__(0, description=description)
 
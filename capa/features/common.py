@@ -104,6 +104,10 @@ class Feature(abc.ABC):  # noqa: B024
     # this is an abstract class, since we don't want anyone to instantiate it directly,
     # but it doesn't have any abstract methods.
 
+    # features are instantiated in bulk during extraction and matching, so avoid the
+    # per-instance `__dict__`; subclasses must declare any extra attributes they add.
+    __slots__ = ("name", "value", "description")
+
     def __init__(
         self,
         value: Union[str, int, float, bytes],
@@ -173,17 +177,23 @@ class Feature(abc.ABC):  # noqa: B024
 
 
 class MatchedRule(Feature):
+    __slots__ = ()
+
     def __init__(self, value: str, description=None):
         super().__init__(value, description=description)
         self.name = "match"
 
 
 class Characteristic(Feature):
+    __slots__ = ()
+
     def __init__(self, value: str, description=None):
         super().__init__(value, description=description)
 
 
 class String(Feature):
+    __slots__ = ()
+
     def __init__(self, value: str, description=None):
         super().__init__(value, description=description)
 
@@ -193,16 +203,22 @@ class String(Feature):
 
 
 class Class(Feature):
+    __slots__ = ()
+
     def __init__(self, value: str, description=None):
         super().__init__(value, description=description)
 
 
 class Namespace(Feature):
+    __slots__ = ()
+
     def __init__(self, value: str, description=None):
         super().__init__(value, description=description)
 
 
 class Substring(String):
+    __slots__ = ()
+
     def __init__(self, value: str, description=None):
         super().__init__(value, description=description)
         self.value = value
@@ -261,6 +277,8 @@ class _MatchedSubstring(Substring):
     note: this type should only ever be constructed by `Substring.evaluate()`. it is not part of the public API.
     """
 
+    __slots__ = ("matches",)
+
     def __init__(self, substring: Substring, matches: Dict[str, Set[Address]]):
         """
         args:
@@ -281,6 +299,8 @@ class _MatchedSubstring(Substring):
 
 
 class Regex(String):
+    __slots__ = ("re",)
+
     def __init__(self, value: str, description=None):
         super().__init__(value, description=description)
         self.value = value
@@ -353,6 +373,8 @@ class _MatchedRegex(Regex):
     note: this type should only ever be constructed by `Regex.evaluate()`. it is not part of the public API.
     """
 
+    __slots__ = ("matches",)
+
     def __init__(self, regex: Regex, matches: Dict[str, Set[Address]]):
         """
         args:
@@ -380,6 +402,8 @@ class StringFactory:
 
 
 class Bytes(Feature):
+    __slots__ = ()
+
     def __init__(self, value: bytes, description=None):
         super().__init__(value, description=description)
         self.value = value
@@ -416,6 +440,8 @@ VALID_ARCH = (ARCH_I386, ARCH_AMD64, ARCH_AARCH64, ARCH_ANY)
 
 
 class Arch(Feature):
+    __slots__ = ()
+
     def __init__(self, value: str, description=None):
         super().__init__(value, description=description)
         self.name = "arch"
@@ -433,6 +459,8 @@ OS_AUTO = "auto"
 
 
 class OS(Feature):
+    __slots__ = ()
+
     def __init__(self, value: str, description=None):
         super().__init__(value, description=description)
         self.name = "os"
@@ -481,6 +509,8 @@ FORMAT_UNKNOWN = "unknown"
 
 
 class Format(Feature):
+    __slots__ = ()
+
     def __init__(self, value: str, description=None):
         super().__init__(value, description=description)
         self.name = "format"
@@ -10,18 +10,24 @@ from capa.features.common import Feature
 
 
 class Export(Feature):
+    __slots__ = ()
+
     def __init__(self, value: str, description=None):
         # value is export name
         super().__init__(value, description=description)
 
 
 class Import(Feature):
+    __slots__ = ()
+
     def __init__(self, value: str, description=None):
         # value is import name
         super().__init__(value, description=description)
 
 
 class Section(Feature):
+    __slots__ = ()
+
     def __init__(self, value: str, description=None):
         # value is section name
         super().__init__(value, description=description)
@@ -30,6 +36,8 @@ class Section(Feature):
 class FunctionName(Feature):
     """recognized name for statically linked function"""
 
+    __slots__ = ()
+
     def __init__(self, name: str, description=None):
         # value is function name
         super().__init__(name, description=description)
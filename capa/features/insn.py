@@ -21,12 +21,16 @@ def hex(n: int) -> str:
 
 
 class API(Feature):
+    __slots__ = ()
+
     def __init__(self, name: str, description=None):
         super().__init__(name, description=description)
 
 
 class _AccessFeature(Feature, abc.ABC):
     # superclass: don't use directly
+    __slots__ = ("access",)
+
     def __init__(self, value: str, access: Optional[str] = None, description: Optional[str] = None):
         super().__init__(value, description=description)
         if access is not None:
@@ -47,11 +51,15 @@ class _AccessFeature(Feature, abc.ABC):
 
 
 class Property(_AccessFeature):
+    __slots__ = ()
+
     def __init__(self, value: str, access: Optional[str] = None, description=None):
         super().__init__(value, access=access, description=description)
 
 
 class Number(Feature):
+    __slots__ = ()
+
     def __init__(self, value: Union[int, float], description=None):
         """
         args:
@@ -78,6 +86,8 @@ MAX_STRUCTURE_SIZE = 0x10000
 
 
 class Offset(Feature):
+    __slots__ = ()
+
     def __init__(self, value: int, description=None):
         """
         args:
@@ -95,6 +105,8 @@ class Offset(Feature):
 
 
 class Mnemonic(Feature):
+    __slots__ = ()
+
     def __init__(self, value: str, description=None):
         super().__init__(value, description=description)
 
@@ -109,6 +121,8 @@ MAX_OPERAND_INDEX = MAX_OPERAND_COUNT - 1
 class _Operand(Feature, abc.ABC):
     # superclass: don't use directly
     # subclasses should set self.name and provide the value string formatter
+    __slots__ = ("index",)
+
     def __init__(self, index: int, value: Union[int, float], description=None):
         super().__init__(value, description=description)
         self.index = index
@@ -121,6 +135,8 @@ class _Operand(Feature, abc.ABC):
 
 
 class OperandNumber(_Operand):
+    __slots__ = ()
+
     # cached names so we don't do extra string formatting every ctor
     NAMES = [f"operand[{i}].number" for i in range(MAX_OPERAND_COUNT)]
 
@@ -148,6 +164,8 @@ class OperandNumber(_Operand):
 
 
 class OperandOffset(_Operand):
+    __slots__ = ()
+
     # cached names so we don't do extra string formatting every ctor
     NAMES = [f"operand[{i}].offset" for i in range(MAX_OPERAND_COUNT)]
 
@@ -63,8 +63,13 @@ class CapaExplorerDataModel(QtCore.QAbstractItemModel):
         for idx in range(self.root_node.childCount()):
             root_index = self.index(idx, 0, QtCore.QModelIndex())
             for model_index in self.iterateChildrenIndexFromRootIndex(root_index, ignore_root=False):
-                model_index.internalPointer().setChecked(False)
-                self.reset_ida_highlighting(model_index.internalPointer(), False)
+                item = model_index.internalPointer()
+                if not item.isChecked():
+                    # nothing to reset; skip the IDA color lookup and change signal that would
+                    # otherwise fire for every single index in the tree
+                    continue
+                item.setChecked(False)
+                self.reset_ida_highlighting(item, False)
                 self.dataChanged.emit(model_index, model_index)
 
     def clear(self):
@@ -10,6 +10,10 @@ from PyQt5.QtCore import Qt
 
 from capa.ida.plugin.model import CapaExplorerDataModel
 
+# QSortFilterProxyModel.setRecursiveFilteringEnabled requires Qt 5.10; IDA 7.4-7.7 bundle
+# Qt 5.6, so fall back to the Python-side subtree scan there
+HAVE_RECURSIVE_FILTERING = QtCore.QT_VERSION >= 0x050A00
+
 
 class CapaExplorerRangeProxyModel(QtCore.QSortFilterProxyModel):
     """filter results based on virtual address range as seen by IDA
@@ -26,6 +30,11 @@ class CapaExplorerRangeProxyModel(QtCore.QSortFilterProxyModel):
         self.min_ea = None
         self.max_ea = None
 
+        if HAVE_RECURSIVE_FILTERING:
+            # accept rows whose descendants match natively (in C++); otherwise every row
+            # would need to rescan its entire subtree from Python on each filter pass
+            self.setRecursiveFilteringEnabled(True)
+
     def lessThan(self, left, right):
         """return True if left item is less than right item, else False
 
@@ -57,13 +66,15 @@ class CapaExplorerRangeProxyModel(QtCore.QSortFilterProxyModel):
         if self.filter_accepts_row_self(row, parent):
             return True
 
+        # the ancestor of this row matches, accept it so matched rows keep their subtree;
+        # rows accepted because a descendant matches are handled by recursive filtering
         alpha = parent
         while alpha.isValid():
             if self.filter_accepts_row_self(alpha.row(), alpha.parent()):
                 return True
             alpha = alpha.parent()
 
-        if self.index_has_accepted_children(row, parent):
+        if not HAVE_RECURSIVE_FILTERING and self.index_has_accepted_children(row, parent):
             return True
 
         return False
@@ -71,6 +82,8 @@ class CapaExplorerRangeProxyModel(QtCore.QSortFilterProxyModel):
     def index_has_accepted_children(self, row, parent):
         """return True if parent has one or more children that match filter, else False
 
+        only used on Qt older than 5.10, where recursive filtering is unavailable
+
         @param row: row number
         @param parent: QModelIndex of parent
         """
@@ -149,6 +162,11 @@ class CapaExplorerSearchProxyModel(QtCore.QSortFilterProxyModel):
         self.query = ""
         self.setFilterKeyColumn(-1)  # all columns
 
+        if HAVE_RECURSIVE_FILTERING:
+            # accept rows whose descendants match natively (in C++); otherwise every row
+            # would need to rescan its entire subtree from Python on each filter pass
+            self.setRecursiveFilteringEnabled(True)
+
     def filterAcceptsRow(self, row, parent):
         """true if the item in the row indicated by the given row and parent
         should be included in the model; otherwise returns false
@@ -162,21 +180,24 @@ class CapaExplorerSearchProxyModel(QtCore.QSortFilterProxyModel):
         if self.filter_accepts_row_self(row, parent):
             return True
 
-        # the parent of this row matches, accept it
+        # the parent of this row matches, accept it; rows accepted because a child
+        # matches are handled by recursive filtering
         alpha = parent
         while alpha.isValid():
             if self.filter_accepts_row_self(alpha.row(), alpha.parent()):
                 return True
             alpha = alpha.parent()
 
-        # this row is a parent, and a child matches, accept it
-        if self.index_has_accepted_children(row, parent):
+        if not HAVE_RECURSIVE_FILTERING and self.index_has_accepted_children(row, parent):
             return True
 
         return False
 
     def index_has_accepted_children(self, row, parent):
-        """returns True if the given row or its children should be accepted"""
+        """returns True if the given row or its children should be accepted
+
+        only used on Qt older than 5.10, where recursive filtering is unavailable
+        """
         source_model = self.sourceModel()
         model_index = source_model.index(row, 0, parent)
 
@@ -212,13 +233,14 @@ class CapaExplorerSearchProxyModel(QtCore.QSortFilterProxyModel):
                 continue
 
             # case in-sensitive matching
-            if self.query.lower() in data.lower():
+            if self.query in data.lower():
                 return True
 
         return False
 
     def set_query(self, query):
-        self.query = query
+        # store lowered once; filter_accepts_row_self compares per cell
+        self.query = query.lower()
         self.invalidateFilter()
 
     def reset_query(self):
@@ -6,6 +6,7 @@
 #  is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and limitations under the License.
 import re
+import itertools
 from typing import Dict, Optional
 from collections import Counter
 
@@ -24,17 +25,53 @@ from capa.ida.plugin.model import CapaExplorerDataModel
 
 MAX_SECTION_SIZE = 750
 
+# number of rows Qt samples when computing ResizeToContents column widths; the default (1000)
+# makes every resize scan effectively the whole tree
+RESIZE_CONTENTS_PRECISION = 32
+
+# delay (ms) used to coalesce bursts of column-resize requests; the ResizeToContents scan
+# then runs once after the last request instead of once per expand/collapse signal
+RESIZE_COLUMNS_DELAY = 120
+
 # default colors used in views
 COLOR_GREEN_RGB = (79, 121, 66)
 COLOR_BLUE_RGB = (37, 147, 215)
 
+# indent strings indexed by width, reused when rendering preview lines; indexing the table
+# avoids allocating a fresh padding string for every node
+INDENTS = tuple(" " * i for i in range(128))
+
+# count features are parsed per line when rendering the preview, so we compile this pattern once
+# instead of paying the regex cache lookup on every call
+# assume format - count(<feature_name>(<feature_value>)): <count>
+COUNT_RE = re.compile(r"- count\(([a-zA-Z]+)\((.+)\)\): (.+)")
+
+# prefixes used to classify lines of rule text; hoisted to module scope so the per-line
+# parsers reference a single tuple instead of building one per call
+EXPRESSION_PREFIXES = ("- and:", "- or:", "- not:", "- basic block:", "- instruction:", "- optional:")
+EXPRESSION_DISPLAY_PREFIXES = ("- and", "- or", "- optional", "- basic block", "- not", "- instruction:")
+
+# rulegen editor column indices and node types; module-level so per-node code doesn't pay a
+# static method call to fetch a constant int. the static getters below remain for callers
+# outside the hot loops
+RULEGEN_COLUMN_FEATURE = 0
+RULEGEN_COLUMN_DESCRIPTION = 1
+RULEGEN_COLUMN_COMMENT = 2
+RULEGEN_NODE_TYPE_EXPRESSION = 0
+RULEGEN_NODE_TYPE_FEATURE = 1
+RULEGEN_NODE_TYPE_COMMENT = 2
+
+# item data role used to store a node's capa type; keeping it in the item model avoids
+# attaching a Python __dict__ to every QTreeWidgetItem wrapper via setattr
+CAPA_TYPE_ROLE = QtCore.Qt.UserRole + 2
+
 
 def calc_indent_from_line(line, prev_level=0):
     """ """
-    if not len(line.strip()):
+    stripped = line.lstrip()
+    if not stripped:
         # blank line, which may occur for comments so we simply use the last level
         return prev_level
-    stripped = line.lstrip()
     if stripped.startswith("description"):
         # need to adjust two spaces when encountering string description
         line = line[2:]
@@ -54,12 +91,19 @@ def parse_yaml_line(feature):
         # count is weird, we need to handle special
         # first, we need to grab the comment, if exists
         # next, we need to check for an embedded description
+        # assume format - count(<feature_name>(<feature_value> = <description>)): <count>
+        # we avoid regex here because this runs once per line when parsing rule text
         feature, _, comment = feature.partition("#")
-        m = re.search(r"- count\(([a-zA-Z]+)\((.+)\s+=\s+(.+)\)\):\s*(.+)", feature)
-        if m:
-            # reconstruct count without description
-            feature, value, description, count = m.groups()
-            feature = f"- count({feature}({value})): {count}"
+        _, lparen, inner = feature.partition("(")
+        body, rparen, count = inner.rpartition(")):")
+        if lparen and rparen:
+            name, lparen, value = body.partition("(")
+            value, eq, description = value.rpartition(" = ")
+            if lparen and eq:
+                # reconstruct count without description
+                feature = f"- count({name}({value})): {count.strip()}"
+            else:
+                description = ""
     elif not feature.startswith("#"):
         feature, _, comment = feature.partition("#")
         feature, _, description = feature.partition("=")
@@ -70,54 +114,67 @@ def parse_yaml_line(feature):
 def parse_node_for_feature(feature, description, comment, depth):
     """ """
     depth = (depth * 2) + 4
-    display = ""
+    indent = INDENTS[depth] if depth < len(INDENTS) else " " * depth
+    indent2 = INDENTS[depth + 2] if depth + 2 < len(INDENTS) else " " * (depth + 2)
+
+    # collect the parts and join once on return; repeated += would copy the growing string
+    # for every piece
+    parts = []
 
     if feature.startswith("#"):
-        display += f"{' '*depth}{feature}\n"
+        parts.append(f"{indent}{feature}\n")
     elif description:
-        if feature.startswith(("- and", "- or", "- optional", "- basic block", "- not", "- instruction:")):
-            display += f"{' '*depth}{feature}\n"
+        if feature.startswith(EXPRESSION_DISPLAY_PREFIXES):
+            parts.append(f"{indent}{feature}\n")
             if comment:
-                display += f" # {comment}"
-            display += f"\n{' '*(depth+2)}- description: {description}\n"
+                parts.append(f" # {comment}")
+            parts.append(f"\n{indent2}- description: {description}\n")
         elif feature.startswith("- string"):
-            display += f"{' '*depth}{feature}\n"
+            parts.append(f"{indent}{feature}\n")
             if comment:
-                display += f" # {comment}"
-            display += f"\n{' '*(depth+2)}description: {description}\n"
+                parts.append(f" # {comment}")
+            parts.append(f"\n{indent2}description: {description}\n")
         elif feature.startswith("- count"):
             # count is weird, we need to format description based on feature type, so we parse with regex
-            # assume format - count(<feature_name>(<feature_value>)): <count>
-            m = re.search(r"- count\(([a-zA-Z]+)\((.+)\)\): (.+)", feature)
+            m = COUNT_RE.search(feature)
             if m:
                 name, value, count = m.groups()
                 if name in ("string",):
-                    display += f"{' '*depth}{feature}"
+                    parts.append(f"{indent}{feature}")
                     if comment:
-                        display += f" # {comment}"
-                    display += f"\n{' '*(depth+2)}description: {description}\n"
+                        parts.append(f" # {comment}")
+                    parts.append(f"\n{indent2}description: {description}\n")
                 else:
-                    display += f"{' '*depth}- count({name}({value} = {description})): {count}"
+                    parts.append(f"{indent}- count({name}({value} = {description})): {count}")
                     if comment:
-                        display += f" # {comment}\n"
+                        parts.append(f" # {comment}\n")
         else:
-            display += f"{' '*depth}{feature} = {description}"
+            parts.append(f"{indent}{feature} = {description}")
             if comment:
-                display += f" # {comment}\n"
+                parts.append(f" # {comment}\n")
     else:
-        display += f"{' '*depth}{feature}"
+        parts.append(f"{indent}{feature}")
         if comment:
-            display += f" # {comment}\n"
+            parts.append(f" # {comment}\n")
 
+    display = "".join(parts)
     return display if display.endswith("\n") else display + "\n"
 
 
 def iterate_tree(o):
     """ """
-    itr = QtWidgets.QTreeWidgetItemIterator(o)
-    while itr.value():
-        yield itr.value()
-        itr += 1
+    # pre-order DFS over plain child accessors; QTreeWidgetItemIterator crosses the
+    # Python/C++ boundary twice per node (value() and increment) which adds up on large trees
+    # o may be a QTreeWidget or a QTreeWidgetItem e.g. invisibleRootItem()
+    if isinstance(o, QtWidgets.QTreeWidget):
+        stack = [o.topLevelItem(i) for i in range(o.topLevelItemCount() - 1, -1, -1)]
+    else:
+        stack = [o.child(i) for i in range(o.childCount() - 1, -1, -1)]
+    while stack:
+        node = stack.pop()
+        yield node
+        for i in range(node.childCount() - 1, -1, -1):
+            stack.append(node.child(i))
 
 
 def expand_tree(root):
@@ -143,7 +200,10 @@ def build_action(o, display, data, slot):
     action = QtWidgets.QAction(display, o)
 
     action.setData(data)
-    action.triggered.connect(lambda checked: slot(action))
+    # connect the slot directly; slots recover the acting QAction via self.sender(), so no
+    # closure needs to be allocated per action (a lambda here also ties the action into a
+    # reference cycle that delays its collection)
+    action.triggered.connect(slot)
 
     return action
 
@@ -163,6 +223,9 @@ def build_context_menu(o, actions):
 
 def resize_columns_to_content(header):
     """ """
+    # bound the number of rows Qt measures; otherwise ResizeToContents walks every visible
+    # row of the tree to find the widest cell
+    header.setResizeContentsPrecision(RESIZE_CONTENTS_PRECISION)
     header.resizeSections(QtWidgets.QHeaderView.ResizeToContents)
     if header.sectionSize(0) > MAX_SECTION_SIZE:
         header.resizeSection(0, MAX_SECTION_SIZE)
@@ -337,6 +400,16 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
         self.expanded.connect(self.slot_resize_columns_to_content)
         self.collapsed.connect(self.slot_resize_columns_to_content)
 
+        # coalesce bursts of resize requests into a single deferred ResizeToContents scan
+        self.resize_columns_timer = QtCore.QTimer(self)
+        self.resize_columns_timer.setSingleShot(True)
+        self.resize_columns_timer.setInterval(RESIZE_COLUMNS_DELAY)
+        self.resize_columns_timer.timeout.connect(self.slot_resize_columns_now)
+
+        # control when we resize columns; expanding many nodes at once would otherwise
+        # trigger one full resize per expansion
+        self.should_resize_columns = True
+
         self.reset_view()
 
         self.is_editing = False
@@ -344,32 +417,32 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
     @staticmethod
     def get_column_feature_index():
         """ """
-        return 0
+        return RULEGEN_COLUMN_FEATURE
 
     @staticmethod
     def get_column_description_index():
         """ """
-        return 1
+        return RULEGEN_COLUMN_DESCRIPTION
 
     @staticmethod
     def get_column_comment_index():
         """ """
-        return 2
+        return RULEGEN_COLUMN_COMMENT
 
     @staticmethod
     def get_node_type_expression():
         """ """
-        return 0
+        return RULEGEN_NODE_TYPE_EXPRESSION
 
     @staticmethod
     def get_node_type_feature():
         """ """
-        return 1
+        return RULEGEN_NODE_TYPE_FEATURE
 
     @staticmethod
     def get_node_type_comment():
         """ """
-        return 2
+        return RULEGEN_NODE_TYPE_COMMENT
 
     def dragMoveEvent(self, e):
         """ """
@@ -387,13 +460,23 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
         super().dropEvent(e)
 
         self.update_preview()
-        expand_tree(self.invisibleRootItem())
+        self.should_resize_columns = False
+        try:
+            expand_tree(self.invisibleRootItem())
+        finally:
+            self.should_resize_columns = True
+        resize_columns_to_content(self.header())
 
     def reset_view(self):
         """ """
         self.clear()
 
     def slot_resize_columns_to_content(self):
+        """ """
+        if self.should_resize_columns:
+            self.resize_columns_timer.start()
+
+    def slot_resize_columns_now(self):
         """ """
         resize_columns_to_content(self.header())
 
@@ -403,7 +486,7 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
             self.update_preview()
             self.is_editing = False
 
-    def slot_remove_selected(self, action):
+    def slot_remove_selected(self):
         """ """
         for o in self.selectedItems():
             if o.parent() is None:
@@ -412,8 +495,10 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
                 continue
             o.parent().removeChild(o)
 
-    def slot_nest_features(self, action):
+    def slot_nest_features(self):
         """ """
+        action = self.sender()
+
         # we don't want to add new features under the invisible root because capa rules should
         # contain a single top-level node; this may not always be the case so we default to the last
         # child node that was added to the invisible root
@@ -438,9 +523,9 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
         # ensure new parent expanded
         new_parent.setExpanded(True)
 
-    def slot_edit_expression(self, action):
+    def slot_edit_expression(self):
         """ """
-        expression, o = action.data()
+        expression, o = self.sender().data()
         if "basic block" in expression and "basic block" not in o.text(
             CapaExplorerRulegenEditor.get_column_feature_index()
         ):
@@ -462,7 +547,7 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
 
         o.setText(CapaExplorerRulegenEditor.get_column_feature_index(), expression)
 
-    def slot_clear_all(self, action):
+    def slot_clear_all(self):
         """ """
         self.reset_view()
 
@@ -471,7 +556,7 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
         if not self.indexAt(pos).isValid():
             # user selected invalid index
             self.load_custom_context_menu_invalid_index(pos)
-        elif self.itemAt(pos).capa_type == CapaExplorerRulegenEditor.get_node_type_expression():
+        elif self.itemAt(pos).data(0, CAPA_TYPE_ROLE) == RULEGEN_NODE_TYPE_EXPRESSION:
             # user selected expression node
             self.load_custom_context_menu_expression(pos)
         else:
@@ -495,16 +580,32 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
         """ """
         rule_text = self.preview.toPlainText()
 
-        if -1 != rule_text.find("features:"):
-            rule_text = rule_text[: rule_text.find("features:") + len("features:")]
-            rule_text += "\n"
+        head, sep, _ = rule_text.partition("features:")
+        if sep:
+            parts = [head, sep, "\n"]
         else:
-            rule_text = rule_text.rstrip()
-            rule_text += "\n  features:\n"
+            parts = [rule_text.rstrip(), "\n  features:\n"]
 
-        for o in iterate_tree(self):
+        # track depth during a single DFS; calling calc_item_depth per node would walk parent
+        # pointers to the root every time
+        stack = [(self.topLevelItem(i), 0) for i in range(self.topLevelItemCount() - 1, -1, -1)]
+        while stack:
+            o, depth = stack.pop()
             feature, description, comment = (o.strip() for o in tuple(o.text(i) for i in range(3)))
-            rule_text += parse_node_for_feature(feature, description, comment, calc_item_depth(o))
+
+            # most edits touch a single node, so cache the rendered text per node and only
+            # re-render nodes whose text or depth changed since the last preview update
+            key = (feature, description, comment, depth)
+            rendered = getattr(o, "capa_render_cache", None)
+            if rendered is None or rendered[0] != key:
+                rendered = (key, parse_node_for_feature(feature, description, comment, depth))
+                setattr(o, "capa_render_cache", rendered)
+            parts.append(rendered[1])
+
+            for i in range(o.childCount() - 1, -1, -1):
+                stack.append((o.child(i), depth + 1))
+
+        rule_text = "".join(parts)
 
         # TODO(mike-hunhoff): we avoid circular update by disabling signals when updating
         # the preview. Preferably we would refactor the code to avoid this
@@ -539,7 +640,9 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
 
         # build submenu with modify actions
         sub_menu = build_context_menu(self.parent(), sub_actions)
-        sub_menu.setTitle(f"Nest feature{'' if len(tuple(self.get_features(selected=True))) == 1 else 's'}")
+        # we only need to know singular vs. plural, so stop iterating after two features
+        selected_count = len(tuple(itertools.islice(self.get_features(selected=True), 2)))
+        sub_menu.setTitle(f"Nest feature{'' if selected_count == 1 else 's'}")
 
         # build main menu with submenu + main actions
         menu = build_context_menu(self.parent(), (sub_menu,) + actions)
@@ -550,13 +653,15 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
         """ """
         actions = (("Remove expression", (), self.slot_remove_selected),)
 
+        # resolve the clicked item once instead of once per action
+        item = self.itemAt(pos)
         sub_actions = (
-            ("and", ("- and:", self.itemAt(pos)), self.slot_edit_expression),
-            ("or", ("- or:", self.itemAt(pos)), self.slot_edit_expression),
-            ("not", ("- not:", self.itemAt(pos)), self.slot_edit_expression),
-            ("optional", ("- optional:", self.itemAt(pos)), self.slot_edit_expression),
-            ("basic block", ("- basic block:", self.itemAt(pos)), self.slot_edit_expression),
-            ("instruction", ("- instruction:", self.itemAt(pos)), self.slot_edit_expression),
+            ("and", ("- and:", item), self.slot_edit_expression),
+            ("or", ("- or:", item), self.slot_edit_expression),
+            ("not", ("- not:", item), self.slot_edit_expression),
+            ("optional", ("- optional:", item), self.slot_edit_expression),
+            ("basic block", ("- basic block:", item), self.slot_edit_expression),
+            ("instruction", ("- instruction:", item), self.slot_edit_expression),
         )
 
         # build submenu with modify actions
@@ -573,7 +678,7 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
         font = QtGui.QFont()
         font.setBold(True)
 
-        o.setFont(CapaExplorerRulegenEditor.get_column_feature_index(), font)
+        o.setFont(RULEGEN_COLUMN_FEATURE, font)
 
     def style_feature_node(self, o):
         """ """
@@ -584,8 +689,8 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
         font.setWeight(QtGui.QFont.Medium)
         brush.setColor(QtGui.QColor(*COLOR_GREEN_RGB))
 
-        o.setFont(CapaExplorerRulegenEditor.get_column_feature_index(), font)
-        o.setForeground(CapaExplorerRulegenEditor.get_column_feature_index(), brush)
+        o.setFont(RULEGEN_COLUMN_FEATURE, font)
+        o.setForeground(RULEGEN_COLUMN_FEATURE, brush)
 
     def style_comment_node(self, o):
         """ """
@@ -593,22 +698,22 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
         font.setBold(True)
         font.setFamily("Courier")
 
-        o.setFont(CapaExplorerRulegenEditor.get_column_feature_index(), font)
+        o.setFont(RULEGEN_COLUMN_FEATURE, font)
 
     def set_expression_node(self, o):
         """ """
-        setattr(o, "capa_type", CapaExplorerRulegenEditor.get_node_type_expression())
+        o.setData(0, CAPA_TYPE_ROLE, RULEGEN_NODE_TYPE_EXPRESSION)
         self.style_expression_node(o)
 
     def set_feature_node(self, o):
         """ """
-        setattr(o, "capa_type", CapaExplorerRulegenEditor.get_node_type_feature())
+        o.setData(0, CAPA_TYPE_ROLE, RULEGEN_NODE_TYPE_FEATURE)
         o.setFlags(o.flags() & ~QtCore.Qt.ItemIsDropEnabled)
         self.style_feature_node(o)
 
     def set_comment_node(self, o):
         """ """
-        setattr(o, "capa_type", CapaExplorerRulegenEditor.get_node_type_comment())
+        o.setData(0, CAPA_TYPE_ROLE, RULEGEN_NODE_TYPE_COMMENT)
         o.setFlags(o.flags() & ~QtCore.Qt.ItemIsDropEnabled)
 
         self.style_comment_node(o)
@@ -639,40 +744,53 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
 
     def update_features(self, features):
         """ """
-        if not self.invisibleRootItem().childCount():
-            # empty tree; add a default node
-            self.new_expression_node(self.invisibleRootItem(), ("- or:", ""))
-
-        # we don't want to add new features under the invisible root because capa rules should
-        # contain a single top-level node; this may not always be the case so we default to the last
-        # child node that was added to the invisible root
-        top_node = self.invisibleRootItem().child(self.invisibleRootItem().childCount() - 1)
-
-        # build feature counts
-        counted = list(zip(Counter(features).keys(), Counter(features).values()))
-
-        # single features
-        for k, _ in filter(lambda t: t[1] == 1, counted):
-            if isinstance(k, (capa.features.common.String,)):
-                value = f'"{capa.features.common.escape_string(k.get_value_str())}"'
-            else:
-                value = k.get_value_str()
-            self.new_feature_node(top_node, (f"- {k.name.lower()}: {value}", ""))
-
-        # n > 1 features
-        for k, v in filter(lambda t: t[1] > 1, counted):
-            if k.value:
-                if isinstance(k, (capa.features.common.String,)):
-                    value = f'"{capa.features.common.escape_string(k.get_value_str())}"'
+        # suppress per-item repaints and itemChanged dispatch while adding many nodes; one
+        # layout pass when updates are re-enabled is enough
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            if not self.invisibleRootItem().childCount():
+                # empty tree; add a default node
+                self.new_expression_node(self.invisibleRootItem(), ("- or:", ""))
+
+            # we don't want to add new features under the invisible root because capa rules should
+            # contain a single top-level node; this may not always be the case so we default to the last
+            # child node that was added to the invisible root
+            top_node = self.invisibleRootItem().child(self.invisibleRootItem().childCount() - 1)
+
+            # create the nodes parentless and attach them with one addChildren call below, so
+            # the widget sees a single batch insertion instead of one model update per node
+            children = []
+
+            # walk the feature counts once, emitting singletons and count() features directly
+            for k, v in Counter(features).items():
+                if v == 1:
+                    if isinstance(k, (capa.features.common.String,)):
+                        value = f'"{capa.features.common.escape_string(k.get_value_str())}"'
+                    else:
+                        value = k.get_value_str()
+                    display = f"- {k.name.lower()}: {value}"
+                elif k.value:
+                    if isinstance(k, (capa.features.common.String,)):
+                        value = f'"{capa.features.common.escape_string(k.get_value_str())}"'
+                    else:
+                        value = k.get_value_str()
+                    display = f"- count({k.name.lower()}({value})): {v}"
                 else:
-                    value = k.get_value_str()
-                display = f"- count({k.name.lower()}({value})): {v}"
-            else:
-                display = f"- count({k.name.lower()}): {v}"
-            self.new_feature_node(top_node, (display, ""))
+                    display = f"- count({k.name.lower()}): {v}"
+                children.append(self.new_feature_node(None, (display, "")))
+
+            top_node.addChildren(children)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
 
         self.update_preview()
-        expand_tree(self.invisibleRootItem())
+        self.should_resize_columns = False
+        try:
+            expand_tree(self.invisibleRootItem())
+        finally:
+            self.should_resize_columns = True
         resize_columns_to_content(self.header())
 
     def make_child_node_from_feature(self, parent, feature):
@@ -712,15 +830,15 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
             node.setText(idx, text)
 
         # we need to set our own type so we can control the GUI accordingly
-        if feature.startswith(("- and:", "- or:", "- not:", "- basic block:", "- instruction:", "- optional:")):
-            setattr(node, "capa_type", CapaExplorerRulegenEditor.get_node_type_expression())
+        if feature.startswith(EXPRESSION_PREFIXES):
+            capa_type = RULEGEN_NODE_TYPE_EXPRESSION
         elif feature.startswith("#"):
-            setattr(node, "capa_type", CapaExplorerRulegenEditor.get_node_type_comment())
+            capa_type = RULEGEN_NODE_TYPE_COMMENT
         else:
-            setattr(node, "capa_type", CapaExplorerRulegenEditor.get_node_type_feature())
+            capa_type = RULEGEN_NODE_TYPE_FEATURE
 
-        # format the node based on its type
-        (self.set_expression_node, self.set_feature_node, self.set_comment_node)[node.capa_type](node)
+        # format the node based on its type; the set_* helper also records the type on the node
+        (self.set_expression_node, self.set_feature_node, self.set_comment_node)[capa_type](node)
 
         parent.addChild(node)
 
@@ -731,71 +849,81 @@ class CapaExplorerRulegenEditor(QtWidgets.QTreeWidget):
         self.reset_view()
 
         # check for lack of features block
-        if -1 == rule_text.find("features:"):
+        _, sep, rule_features = rule_text.partition("features:")
+        if not sep:
             return
 
-        rule_features = rule_text[rule_text.find("features:") + len("features:") :].strip("\n")
+        rule_features = rule_features.strip("\n")
 
         if not rule_features:
             # no features; nothing to do
             return
 
-        # build tree from yaml text using stack-based algorithm to build parent -> child edges
-        stack = [self.invisibleRootItem()]
-        for line in rule_features.splitlines():
-            if not len(line.strip()):
-                continue
-
-            indent = calc_indent_from_line(line)
-
-            # we need to grow our stack to ensure proper parent -> child edges
-            if indent > len(stack):
-                stack.extend([None] * (indent - len(stack)))
-
-            # shave the stack; divide by 2 because even indent, add 1 to avoid shaving root node
-            stack[indent // 2 + 1 :] = []
-
-            # find our parent; should be last node in stack not None
-            parent = None
-            for o in stack[::-1]:
-                if o:
-                    parent = o
-                    break
-
-            node = self.make_child_node_from_feature(parent, parse_yaml_line(line.strip()))
-
-            # append our new node in case it's a parent for another node
-            if node:
-                stack.append(node)
+        # suppress per-item repaints and itemChanged dispatch while building the tree; one
+        # layout pass when updates are re-enabled is enough
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            # build tree from yaml text using stack-based algorithm to build parent -> child edges
+            stack = [self.invisibleRootItem()]
+            for line in rule_features.splitlines():
+                if not len(line.strip()):
+                    continue
+
+                indent = calc_indent_from_line(line)
+
+                # we need to grow our stack to ensure proper parent -> child edges
+                if indent > len(stack):
+                    stack.extend([None] * (indent - len(stack)))
+
+                # shave the stack; divide by 2 because even indent, add 1 to avoid shaving root node
+                stack[indent // 2 + 1 :] = []
+
+                # find our parent; should be last node in stack not None
+                parent = None
+                for o in reversed(stack):
+                    if o:
+                        parent = o
+                        break
+
+                node = self.make_child_node_from_feature(parent, parse_yaml_line(line.strip()))
+
+                # append our new node in case it's a parent for another node
+                if node:
+                    stack.append(node)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
 
         if update_preview:
             self.preview.blockSignals(True)
             self.preview.setPlainText(rule_text)
             self.preview.blockSignals(False)
 
-        expand_tree(self.invisibleRootItem())
+        self.should_resize_columns = False
+        try:
+            expand_tree(self.invisibleRootItem())
+        finally:
+            self.should_resize_columns = True
+        resize_columns_to_content(self.header())
 
     def get_features(self, selected=False, ignore=()):
         """ """
-        for feature in filter(
-            lambda o: o.capa_type
-            in (CapaExplorerRulegenEditor.get_node_type_feature(), CapaExplorerRulegenEditor.get_node_type_comment()),
-            tuple(iterate_tree(self)),
-        ):
-            if feature in ignore:
+        # when only selected items are requested, iterate the selection directly; it's typically
+        # a handful of items vs. the entire tree
+        for feature in self.selectedItems() if selected else iterate_tree(self):
+            if feature.data(0, CAPA_TYPE_ROLE) not in (RULEGEN_NODE_TYPE_FEATURE, RULEGEN_NODE_TYPE_COMMENT):
                 continue
-            if selected and not feature.isSelected():
+            if feature in ignore:
                 continue
             yield feature
 
     def get_expressions(self, selected=False, ignore=()):
         """ """
-        for expression in filter(
-            lambda o: o.capa_type == CapaExplorerRulegenEditor.get_node_type_expression(), tuple(iterate_tree(self))
-        ):
-            if expression in ignore:
+        for expression in self.selectedItems() if selected else iterate_tree(self):
+            if expression.data(0, CAPA_TYPE_ROLE) != RULEGEN_NODE_TYPE_EXPRESSION:
                 continue
-            if selected and not expression.isSelected():
+            if expression in ignore:
                 continue
             yield expression
 
@@ -825,6 +953,16 @@ class CapaExplorerRulegenFeatures(QtWidgets.QTreeWidget):
         self.expanded.connect(self.slot_resize_columns_to_content)
         self.collapsed.connect(self.slot_resize_columns_to_content)
 
+        # coalesce bursts of resize requests into a single deferred ResizeToContents scan
+        self.resize_columns_timer = QtCore.QTimer(self)
+        self.resize_columns_timer.setSingleShot(True)
+        self.resize_columns_timer.setInterval(RESIZE_COLUMNS_DELAY)
+        self.resize_columns_timer.timeout.connect(self.slot_resize_columns_now)
+
+        # control when we resize columns; filtering expands many nodes at once and we only
+        # want the final resize
+        self.should_resize_columns = True
+
         self.reset_view()
 
     @staticmethod
@@ -852,16 +990,21 @@ class CapaExplorerRulegenFeatures(QtWidgets.QTreeWidget):
         self.clear()
 
     def slot_resize_columns_to_content(self):
+        """ """
+        if self.should_resize_columns:
+            self.resize_columns_timer.start()
+
+    def slot_resize_columns_now(self):
         """ """
         resize_columns_to_content(self.header())
 
-    def slot_add_selected_features(self, action):
+    def slot_add_selected_features(self):
         """ """
         selected = [item.data(0, 0x100) for item in self.selectedItems()]
         if selected:
             self.editor.update_features(selected)
 
-    def slot_add_n_bytes_feature(self, action):
+    def slot_add_n_bytes_feature(self):
         """ """
         count = idaapi.ask_long(16, f"Enter number of bytes (1-{capa.features.common.MAX_BYTES_FEATURE_SIZE}):")
         if count and 1 <= count <= capa.features.common.MAX_BYTES_FEATURE_SIZE:
@@ -874,13 +1017,15 @@ class CapaExplorerRulegenFeatures(QtWidgets.QTreeWidget):
         actions = []
         action_add_features_fmt = ""
 
-        selected_items_count = len(self.selectedItems())
+        # query the selection once; selectedItems() builds a fresh list each call
+        selected_items = self.selectedItems()
+        selected_items_count = len(selected_items)
         if selected_items_count == 0:
             return
 
         if selected_items_count == 1:
             action_add_features_fmt = "Add feature"
-            if isinstance(self.selectedItems()[0].data(0, 0x100), capa.features.common.Bytes):
+            if isinstance(selected_items[0].data(0, 0x100), capa.features.common.Bytes):
                 actions.append(("Add n bytes...", (), self.slot_add_n_bytes_feature))
         else:
             action_add_features_fmt = f"Add {selected_items_count} features"
@@ -894,7 +1039,7 @@ class CapaExplorerRulegenFeatures(QtWidgets.QTreeWidget):
         """ """
         if column == CapaExplorerRulegenFeatures.get_column_address_index() and o.text(column):
             idc.jumpto(int(o.text(column), 0x10))
-        elif o.capa_type == CapaExplorerRulegenFeatures.get_node_type_leaf():
+        elif o.data(0, CAPA_TYPE_ROLE) == CapaExplorerRulegenFeatures.get_node_type_leaf():
             self.editor.update_features([o.data(0, 0x100)])
 
     def show_all_items(self):
@@ -906,21 +1051,37 @@ class CapaExplorerRulegenFeatures(QtWidgets.QTreeWidget):
     def filter_items_by_text(self, text):
         """ """
         if text:
-            for o in iterate_tree(self):
-                data = o.data(0, 0x100)
-                if data:
-                    to_match = data.get_value_str()
-                    if not to_match or text.lower() not in to_match.lower():
-                        if not o.isHidden():
-                            o.setHidden(True)
-                        continue
-                if o.isHidden():
-                    o.setHidden(False)
-                if o.childCount() and not o.isExpanded():
-                    o.setExpanded(True)
+            needle = text.lower()
+            self.should_resize_columns = False
+            try:
+                self._filter_items_by_needle(needle)
+            finally:
+                self.should_resize_columns = True
+            resize_columns_to_content(self.header())
         else:
             self.show_all_items()
 
+    def _filter_items_by_needle(self, needle):
+        """ """
+        for o in iterate_tree(self):
+            data = o.data(0, 0x100)
+            if data:
+                # cache the lowercase value on the item; this runs per keystroke so we don't
+                # want to recompute it for every item every time
+                to_match = getattr(o, "capa_match_text", None)
+                if to_match is None:
+                    value = data.get_value_str()
+                    to_match = value.lower() if value else ""
+                    setattr(o, "capa_match_text", to_match)
+                if not to_match or needle not in to_match:
+                    if not o.isHidden():
+                        o.setHidden(True)
+                    continue
+            if o.isHidden():
+                o.setHidden(False)
+            if o.childCount() and not o.isExpanded():
+                o.setExpanded(True)
+
     def filter_items_by_ea(self, min_ea, max_ea=None):
         """ """
         visited = []
@@ -935,30 +1096,35 @@ class CapaExplorerRulegenFeatures(QtWidgets.QTreeWidget):
                     _o.setExpanded(True)
                 _o = _o.parent()
 
-        for o in iterate_tree(self):
-            if o in visited:
-                # save some cycles, only visit item once
-                continue
+        # suppress the expansion-triggered resizes; we resize once below
+        self.should_resize_columns = False
+        try:
+            for o in iterate_tree(self):
+                if o in visited:
+                    # save some cycles, only visit item once
+                    continue
 
-            # read ea from "Address" column
-            o_ea = o.text(CapaExplorerRulegenFeatures.get_column_address_index())
+                # read ea from "Address" column
+                o_ea = o.text(CapaExplorerRulegenFeatures.get_column_address_index())
 
-            if o_ea == "":
-                # ea may be empty, hide by default
-                if not o.isHidden():
-                    o.setHidden(True)
-                continue
+                if o_ea == "":
+                    # ea may be empty, hide by default
+                    if not o.isHidden():
+                        o.setHidden(True)
+                    continue
 
-            o_ea = int(o_ea, 16)
+                o_ea = int(o_ea, 16)
 
-            if max_ea is not None and min_ea <= o_ea <= max_ea:
-                show_item_and_parents(o)
-            elif o_ea == min_ea:
-                show_item_and_parents(o)
-            else:
-                # made it here, hide by default
-                if not o.isHidden():
-                    o.setHidden(True)
+                if max_ea is not None and min_ea <= o_ea <= max_ea:
+                    show_item_and_parents(o)
+                elif o_ea == min_ea:
+                    show_item_and_parents(o)
+                else:
+                    # made it here, hide by default
+                    if not o.isHidden():
+                        o.setHidden(True)
+        finally:
+            self.should_resize_columns = True
 
         # resize the view for UX
         resize_columns_to_content(self.header())
@@ -987,12 +1153,12 @@ class CapaExplorerRulegenFeatures(QtWidgets.QTreeWidget):
     def set_parent_node(self, o):
         """ """
         o.setFlags(o.flags() & ~QtCore.Qt.ItemIsSelectable)
-        setattr(o, "capa_type", CapaExplorerRulegenFeatures.get_node_type_parent())
+        o.setData(0, CAPA_TYPE_ROLE, CapaExplorerRulegenFeatures.get_node_type_parent())
         self.style_parent_node(o)
 
     def set_leaf_node(self, o):
         """ """
-        setattr(o, "capa_type", CapaExplorerRulegenFeatures.get_node_type_leaf())
+        o.setData(0, CAPA_TYPE_ROLE, CapaExplorerRulegenFeatures.get_node_type_leaf())
         self.style_leaf_node(o)
 
     def new_parent_node(self, parent, data, feature=None):
@@ -1021,9 +1187,17 @@ class CapaExplorerRulegenFeatures(QtWidgets.QTreeWidget):
 
     def load_features(self, file_features, func_features: Optional[Dict] = None):
         """ """
-        self.parse_features_for_tree(self.new_parent_node(self, ("File Scope",)), file_features)
-        if func_features:
-            self.parse_features_for_tree(self.new_parent_node(self, ("Function/Basic Block Scope",)), func_features)
+        # suppress per-item repaints and signal dispatch while adding many nodes; one layout
+        # pass when updates are re-enabled is enough
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            self.parse_features_for_tree(self.new_parent_node(self, ("File Scope",)), file_features)
+            if func_features:
+                self.parse_features_for_tree(self.new_parent_node(self, ("Function/Basic Block Scope",)), func_features)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
         resize_columns_to_content(self.header())
 
     def parse_features_for_tree(self, parent, features):
@@ -1044,12 +1218,20 @@ class CapaExplorerRulegenFeatures(QtWidgets.QTreeWidget):
                 value = f'"{capa.features.common.escape_string(value)}"'
             return f"{name}({value})"
 
-        for feature, addrs in sorted(features.items(), key=lambda k: sorted(k[1])):
+        # sort each feature's addresses once up front; sorting inside the key lambda would redo
+        # it for every comparison, and the sorted addresses are reused when adding leaves below
+        items_with_keys = [(sorted(addrs), feature) for feature, addrs in features.items()]
+        items_with_keys.sort(key=lambda t: t[0])
+
+        for addrs, feature in items_with_keys:
             if isinstance(feature, capa.features.basicblock.BasicBlock):
                 # filter basic blocks for now, we may want to add these back in some time
                 # in the future
                 continue
 
+            # format the feature once; it's reused for every address below
+            display = format_feature(feature)
+
             # level 0
             if type(feature) not in self.parent_items:
                 self.parent_items[type(feature)] = self.new_parent_node(parent, (feature.name.lower(),))
@@ -1058,26 +1240,26 @@ class CapaExplorerRulegenFeatures(QtWidgets.QTreeWidget):
             if feature not in self.parent_items:
                 if len(addrs) > 1:
                     self.parent_items[feature] = self.new_parent_node(
-                        self.parent_items[type(feature)], (format_feature(feature),), feature=feature
+                        self.parent_items[type(feature)], (display,), feature=feature
                     )
                 else:
                     self.parent_items[feature] = self.new_leaf_node(
-                        self.parent_items[type(feature)], (format_feature(feature),), feature=feature
+                        self.parent_items[type(feature)], (display,), feature=feature
                     )
 
             # level n > 1
             if len(addrs) > 1:
-                for addr in sorted(addrs):
-                    self.new_leaf_node(
-                        self.parent_items[feature], (format_feature(feature), format_address(addr)), feature=feature
-                    )
+                # create the leaves parentless and attach them in one batch, so the widget sees
+                # a single model update per feature instead of one per address
+                leaves = [self.new_leaf_node(None, (display, format_address(addr)), feature=feature) for addr in addrs]
+                self.parent_items[feature].addChildren(leaves)
             else:
                 if addrs:
-                    addr = addrs.pop()
+                    addr = addrs[0]
                 else:
                     # some features may not have an address e.g. "format"
                     addr = _NoAddress()
-                for i, v in enumerate((format_feature(feature), format_address(addr))):
+                for i, v in enumerate((display, format_address(addr))):
                     self.parent_items[feature].setText(i, v)
                 self.parent_items[feature].setData(0, 0x100, feature)
 
@@ -1100,6 +1282,13 @@ class CapaExplorerQtreeView(QtWidgets.QTreeView):
         self.model = model
         self.parent = parent
 
+        # resolve the proxy chain down to the CapaExplorerDataModel once; the model is fixed
+        # for the lifetime of the view and map_index_to_source_item runs per user interaction
+        self.proxy_chain = []
+        while not isinstance(model, CapaExplorerDataModel):
+            self.proxy_chain.append(model)
+            model = model.sourceModel()
+
         # control when we resize columns
         self.should_resize_columns = True
 
@@ -1109,6 +1298,12 @@ class CapaExplorerQtreeView(QtWidgets.QTreeView):
         self.setSortingEnabled(True)
         self.model.setDynamicSortFilter(False)
 
+        # every row renders plain single-line text in the same font, so tell Qt to lay out
+        # with a single row height instead of measuring each visible row; also skip the
+        # expand/collapse animation, which repaints the subtree per frame
+        self.setUniformRowHeights(True)
+        self.setAnimated(False)
+
         # configure view columns to auto-resize
         for idx in range(CapaExplorerDataModel.COLUMN_COUNT):
             self.header().setSectionResizeMode(idx, QtWidgets.QHeaderView.Interactive)
@@ -1120,6 +1315,12 @@ class CapaExplorerQtreeView(QtWidgets.QTreeView):
         self.expanded.connect(self.slot_resize_columns_to_content)
         self.collapsed.connect(self.slot_resize_columns_to_content)
 
+        # coalesce bursts of resize requests into a single deferred ResizeToContents scan
+        self.resize_columns_timer = QtCore.QTimer(self)
+        self.resize_columns_timer.setSingleShot(True)
+        self.resize_columns_timer.setInterval(RESIZE_COLUMNS_DELAY)
+        self.resize_columns_timer.timeout.connect(self.slot_resize_columns_now)
+
         # connect slots
         self.customContextMenuRequested.connect(self.slot_custom_context_menu_requested)
         self.doubleClicked.connect(self.slot_double_click)
@@ -1133,19 +1334,29 @@ class CapaExplorerQtreeView(QtWidgets.QTreeView):
 
         @param should_sort: True, sort results after reset, False don't sort results after reset
         """
-        if should_sort:
-            self.sortByColumn(CapaExplorerDataModel.COLUMN_INDEX_RULE_INFORMATION, QtCore.Qt.AscendingOrder)
-
+        # batch the sort and expansion under a single repaint; expanding node by node would
+        # otherwise trigger a relayout per expanded row
+        self.setUpdatesEnabled(False)
         self.should_resize_columns = False
-        self.expandToDepth(0)
-        self.should_resize_columns = True
+        try:
+            if should_sort:
+                self.sortByColumn(CapaExplorerDataModel.COLUMN_INDEX_RULE_INFORMATION, QtCore.Qt.AscendingOrder)
+
+            self.expandToDepth(0)
+        finally:
+            self.should_resize_columns = True
+            self.setUpdatesEnabled(True)
 
         self.slot_resize_columns_to_content()
 
     def slot_resize_columns_to_content(self):
         """reset view columns to contents"""
         if self.should_resize_columns:
-            resize_columns_to_content(self.header())
+            self.resize_columns_timer.start()
+
+    def slot_resize_columns_now(self):
+        """run the pending column resize"""
+        resize_columns_to_content(self.header())
 
     def map_index_to_source_item(self, model_index):
         """map proxy model index to source model item
@@ -1158,16 +1369,14 @@ class CapaExplorerQtreeView(QtWidgets.QTreeView):
         #  - CapaExplorerDataModel, or
         #  - QSortFilterProxyModel subclass
         #
-        # The ProxyModels may be chained,
-        #  so keep resolving the index the CapaExplorerDataModel.
+        # The ProxyModels may be chained, so map through the chain resolved at init
+        # until we reach the CapaExplorerDataModel.
 
-        model = self.model
-        while not isinstance(model, CapaExplorerDataModel):
+        for proxy in self.proxy_chain:
             if not model_index.isValid():
                 raise ValueError("invalid index")
 
-            model_index = model.mapToSource(model_index)
-            model = model.sourceModel()
+            model_index = proxy.mapToSource(model_index)
 
         if not model_index.isValid():
             raise ValueError("invalid index")
@@ -1194,7 +1403,8 @@ class CapaExplorerQtreeView(QtWidgets.QTreeView):
         """
         action = QtWidgets.QAction(display, self.parent)
         action.setData(data)
-        action.triggered.connect(lambda checked: slot(action))
+        # slots recover the acting QAction via self.sender(); see build_action
+        action.triggered.connect(slot)
 
         return action
 
@@ -1275,34 +1485,28 @@ class CapaExplorerQtreeView(QtWidgets.QTreeView):
         if menu:
             menu.exec_(self.viewport().mapToGlobal(pos))
 
-    def slot_copy_column(self, action):
+    def slot_copy_column(self):
         """slot connected to custom context menu
 
         allows user to select a column and copy the data to clipboard
-
-        @param action: QAction
         """
-        _, item, model_index = action.data()
+        _, item, model_index = self.sender().data()
         self.send_data_to_clipboard(item.data(model_index.column()))
 
-    def slot_copy_row(self, action):
+    def slot_copy_row(self):
         """slot connected to custom context menu
 
         allows user to select a row and copy the space-delimited data to clipboard
-
-        @param action: QAction
         """
-        _, item, _ = action.data()
+        _, item, _ = self.sender().data()
         self.send_data_to_clipboard(str(item))
 
-    def slot_rename_function(self, action):
+    def slot_rename_function(self):
         """slot connected to custom context menu
 
         allows user to select a edit a function name and push changes to IDA
-
-        @param action: QAction
         """
-        _, item, model_index = action.data()
+        _, item, model_index = self.sender().data()
 
         # make item temporary edit, reset after user is finished
         item.setIsEditable(True)
@@ -1355,4 +1559,9 @@ class CapaExplorerQtreeView(QtWidgets.QTreeView):
 
         if CapaExplorerDataModel.COLUMN_INDEX_RULE_INFORMATION == column:
             # user double-clicked information column - un/expand
-            self.collapse(model_index) if self.isExpanded(model_index) else self.expand(model_index)
+            # suspend repaints so the toggle (and the column resize it signals) renders once
+            self.setUpdatesEnabled(False)
+            try:
+                self.collapse(model_index) if self.isExpanded(model_index) else self.expand(model_index)
+            finally:
+                self.setUpdatesEnabled(True)
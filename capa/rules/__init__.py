@@ -853,8 +853,14 @@ class Rule:
         """
         deps: Set[str] = set()
 
-        def rec(statement):
-            if isinstance(statement, capa.features.common.MatchedRule):
+        # walk with an explicit stack, like extract_all_features.
+        # match statements are recognized by exact type (MatchedRule is never subclassed),
+        # a single pointer compare, rather than paying an isinstance MRO walk
+        # for every leaf feature visited.
+        stack: List[Union[Statement, Feature]] = [self.statement]
+        while stack:
+            statement = stack.pop()
+            if type(statement) is capa.features.common.MatchedRule:  # noqa: E721
                 # we're not sure at this point if the `statement.value` is
                 #  really a rule name or a namespace name (we use `MatchedRule` for both cases).
                 # we'll give precedence to namespaces, and then assume if that does work,
@@ -872,13 +878,11 @@ class Rule:
                     deps.add(statement.value)
 
             elif isinstance(statement, ceng.Statement):
-                for child in statement.get_children():
-                    rec(child)
+                stack.extend(statement.get_children())
 
             # else: might be a Feature, etc.
             # which we don't care about here.
 
-        rec(self.statement)
         return deps
 
     def _extract_subscope_rules_rec(self, statement):
@@ -960,19 +964,9 @@ class Rule:
 
         yield from self._extract_subscope_rules_rec(self.statement)
 
-    def _extract_all_features_rec(self, statement) -> Set[Feature]:
-        feature_set: Set[Feature] = set()
-
-        for child in statement.get_children():
-            if isinstance(child, Statement):
-                feature_set.update(self._extract_all_features_rec(child))
-            else:
-                feature_set.add(child)
-        return feature_set
-
     def extract_all_features(self) -> Set[Feature]:
         """
-        recursively extracts all feature statements in this rule.
+        extracts all feature statements in this rule.
 
         returns:
             set: A set of all feature statements contained within this rule.
@@ -985,7 +979,19 @@ class Rule:
                 self.statement,
             }
 
-        return self._extract_all_features_rec(self.statement)
+        # walk the statement tree with an explicit stack; recursing with one set per nested
+        # statement allocates an intermediate set at every level and risks the recursion limit
+        # on deeply nested rules
+        feature_set: Set[Feature] = set()
+        stack: List[Statement] = [self.statement]
+        while stack:
+            statement = stack.pop()
+            for child in statement.get_children():
+                if isinstance(child, Statement):
+                    stack.append(child)
+                else:
+                    feature_set.add(child)
+        return feature_set
 
     def evaluate(self, features: FeatureSet, short_circuit=True):
         capa.perf.counters["evaluate.feature"] += 1
@@ -1087,9 +1093,11 @@ class Rule:
 
     @classmethod
     def from_yaml_file(cls, path, use_ruamel=False) -> "Rule":
-        with Path(path).open("rb") as f:
+        # read in text mode so the content is decoded incrementally,
+        # rather than holding both the raw bytes and the decoded string in memory.
+        with Path(path).open("r", encoding="utf-8") as f:
             try:
-                rule = cls.from_yaml(f.read().decode("utf-8"), use_ruamel=use_ruamel)
+                rule = cls.from_yaml(f.read(), use_ruamel=use_ruamel)
                 # import here to avoid circular dependency
                 from capa.render.result_document import RuleMetadata
 
@@ -152,7 +152,9 @@ def load_cached_ruleset(cache_dir: Path, rule_contents: List[bytes]) -> Optional
 
     try:
         cache = RuleCache.load(buf)
-    except AssertionError:
+    except (AssertionError, AttributeError, TypeError, EOFError, pickle.PickleError, zlib.error):
+        # unpickling fails when the cache was written by a capa whose class layouts
+        # no longer match the current ones, such as during development.
         logger.debug("rule set cache is invalid: %s", path)
         # delete the cache that seems to be invalid.
         path.unlink()
@@ -8,11 +8,13 @@
 import sys
 import logging
 import argparse
-from typing import Set
+from typing import Set, Dict, List
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
 import capa.main
 import capa.rules
+import capa.rules.cache
 from capa.features.common import Feature
 
 logger = logging.getLogger("detect_duplicate_features")
@@ -28,37 +30,113 @@ def get_features(rule_path: str) -> Set[Feature]:
     Returns:
         set: A set of all feature statements contained within the rule file.
     """
-    with Path(rule_path).open("r", encoding="utf-8") as f:
-        try:
-            new_rule = capa.rules.Rule.from_yaml(f.read())
-            return new_rule.extract_all_features()
-        except Exception as e:
-            logger.error("Error: New rule %s %s %s", rule_path, str(type(e)), str(e))
-            sys.exit(-1)
-
-
-def find_overlapping_rules(new_rule_path, rules_path):
-    if not new_rule_path.endswith(".yml"):
-        logger.error("FileNotFoundError ! New rule file name doesn't end with .yml")
+    try:
+        # parse the same way get_rules does for the ruleset side; note we intentionally skip
+        # the meta validation of Rule.from_yaml_file so works-in-progress can be checked too
+        new_rule = capa.rules.Rule.from_yaml(Path(rule_path).read_text(encoding="utf-8"))
+        return new_rule.extract_all_features()
+    except Exception as e:
+        logger.error("Error: New rule %s %s %s", rule_path, str(type(e)), str(e))
         sys.exit(-1)
 
-    # Loads features of new rule in a list.
-    new_rule_features = get_features(new_rule_path)
-    count = 0
-    overlapping_rules = []
 
-    # capa.rules.RuleSet stores all rules in given paths
-    ruleset = capa.rules.get_rules(rules_path)
+def build_feature_index(ruleset: capa.rules.RuleSet) -> Dict[Feature, Set[str]]:
+    """
+    Builds an inverted index over a ruleset, mapping each feature to the names of the
+    rules that contain it.
 
+    Args:
+        ruleset (capa.rules.RuleSet): The ruleset to index.
+
+    Returns:
+        dict: A mapping of feature to the set of names of rules containing that feature.
+    """
+    feature_index: Dict[Feature, Set[str]] = {}
     for rule_name, rule in ruleset.rules.items():
-        rule_features = rule.extract_all_features()
+        for feature in _rule_features(rule):
+            feature_index.setdefault(feature, set()).add(rule_name)
+    return feature_index
+
+
+def _rule_features(rule: capa.rules.Rule) -> Set[Feature]:
+    """
+    Extracts a rule's features, memoized on the rule object so that batch callers
+    (e.g. checking many new rules against one ruleset) traverse each rule only once.
+    """
+    features = getattr(rule, "_cached_features", None)
+    if features is None:
+        features = rule.extract_all_features()
+        setattr(rule, "_cached_features", features)
+    return features
+
+
+def _parse_rule_content(content: str) -> capa.rules.Rule:
+    # module-level so it can be pickled into pool workers
+    return capa.rules.Rule.from_yaml(content)
+
+
+def load_ruleset(rules_path: List[Path]) -> capa.rules.RuleSet:
+    """
+    Loads a ruleset like capa.rules.get_rules, but parses rule files across a process pool
+    when the on-disk ruleset cache misses.
 
-        if not len(rule_features):
-            continue
-        count += 1
-        # Checks if any features match between existing and new rule.
-        if any(feature in rule_features for feature in new_rule_features):
-            overlapping_rules.append(rule_name)
+    YAML parsing dominates cold ruleset loads and each file parses independently, so this
+    is safe to fan out; we don't parallelize get_rules itself because that routine also
+    runs embedded in IDA and Ghidra where spawning worker processes is not an option.
+
+    Args:
+        rules_path (list): Paths to rules files or directories containing rules files.
+
+    Returns:
+        capa.rules.RuleSet: The parsed ruleset.
+    """
+    cache_dir = capa.rules.cache.get_default_cache_directory()
+    rule_file_paths = capa.rules.collect_rule_file_paths(rules_path)
+    rule_contents = [file_path.read_bytes() for file_path in rule_file_paths]
+
+    ruleset = capa.rules.cache.load_cached_ruleset(cache_dir, rule_contents)
+    if ruleset is not None:
+        return ruleset
+
+    with ProcessPoolExecutor() as executor:
+        rules = list(executor.map(_parse_rule_content, (buf.decode("utf-8") for buf in rule_contents), chunksize=16))
+
+    for file_path, rule in zip(rule_file_paths, rules):
+        rule.meta["capa/path"] = file_path.as_posix()
+        rule.meta["capa/nursery"] = capa.rules.is_nursery_rule_path(file_path)
+
+    ruleset = capa.rules.RuleSet(rules)
+    capa.rules.cache.cache_ruleset(cache_dir, ruleset)
+    return ruleset
+
+
+def find_overlapping_rules(new_rule_features: Set[Feature], rules_path):
+    # capa.rules.RuleSet stores all rules in given paths
+    ruleset = load_ruleset(rules_path)
+
+    # invert the ruleset once so each query is a dict probe per new-rule feature rather
+    # than a scan over every rule; the parsed ruleset itself is cached on disk as in get_rules
+    feature_index = build_feature_index(ruleset)
+
+    # number of rules with at least one feature, i.e. rules that appear in the index
+    indexed_rule_names: Set[str] = set()
+    for rule_names in feature_index.values():
+        indexed_rule_names.update(rule_names)
+    count = len(indexed_rule_names)
+
+    # probe from the smaller side: usually the new rule has far fewer features than the
+    # index has entries, but flip the direction when it doesn't
+    hits: Set[str] = set()
+    if len(new_rule_features) <= len(feature_index):
+        for feature in new_rule_features:
+            hits.update(feature_index.get(feature, ()))
+    else:
+        for feature, rule_names in feature_index.items():
+            if feature in new_rule_features:
+                hits.update(rule_names)
+
+    # report overlaps in ruleset order to keep the output stable
+    overlapping_rules = [rule_name for rule_name in ruleset.rules if rule_name in hits]
 
     result = {"overlapping_rules": overlapping_rules, "count": count}
     return result
@@ -75,7 +153,15 @@ def main():
     new_rule_path = args.new_rule
     rules_path = [Path(rule) for rule in args.rules]
 
-    result = find_overlapping_rules(new_rule_path, rules_path)
+    if not new_rule_path.endswith(".yml"):
+        logger.error("FileNotFoundError ! New rule file name doesn't end with .yml")
+        sys.exit(-1)
+
+    # parse the new rule once up front; find_overlapping_rules works on the extracted
+    # feature set so repeated queries don't re-read the file
+    new_rule_features = get_features(new_rule_path)
+
+    result = find_overlapping_rules(new_rule_features, rules_path)
 
     print("\nNew rule path : %s" % new_rule_path)
     print("Number of rules checked : %s " % result["count"])